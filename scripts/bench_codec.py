@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""Per-RPC cty codec benchmark for the nested-schema test components.
+
+Builds a representative value for each component schema and times the
+DynamicValue round trip every RPC pays: ``unmarshal`` of the incoming
+msgpack and ``marshal`` of the outgoing state. The
+``pyvider_nested_data_processor`` function has no schema of its own, so its
+case times what CallFunction pays instead: ``unmarshal`` of each string
+argument and ``marshal`` of the JSON string it returns. Run it before and
+after a pyvider upgrade to compare codec cost per RPC:
+
+    python scripts/bench_codec.py --width 32 --iterations 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+
+def sample_value(cty_type: Any, width: int, depth: int = 0) -> Any:
+    """Build a raw Python value conforming to ``cty_type`` with ``width`` entries per collection."""
+    from pyvider.cty import (
+        CtyBool,
+        CtyDynamic,
+        CtyList,
+        CtyMap,
+        CtyNumber,
+        CtyObject,
+        CtySet,
+        CtyString,
+        CtyTuple,
+    )
+
+    if isinstance(cty_type, CtyString):
+        return f"value-{depth}"
+    if isinstance(cty_type, CtyNumber):
+        return 42
+    if isinstance(cty_type, CtyBool):
+        return True
+    if isinstance(cty_type, CtyMap):
+        return {f"key_{i}": sample_value(cty_type.element_type, width, depth + 1) for i in range(width)}
+    if isinstance(cty_type, CtyList | CtySet):
+        element = cty_type.element_type
+        if isinstance(element, CtyString):
+            return [f"item-{i}" for i in range(width)]
+        return [sample_value(element, width, depth + 1) for _ in range(width)]
+    if isinstance(cty_type, CtyTuple):
+        return [sample_value(t, width, depth + 1) for t in cty_type.element_types]
+    if isinstance(cty_type, CtyObject):
+        return {name: sample_value(t, width, depth + 1) for name, t in cty_type.attribute_types.items()}
+    if isinstance(cty_type, CtyDynamic):
+        # Dynamic attributes carry arbitrary nested documents in these components.
+        return {
+            f"entry_{i}": {"name": f"entry-{i}", "port": 8000 + i, "enabled": i % 2 == 0, "tags": ["a", "b"]}
+            for i in range(width)
+        }
+    raise TypeError(f"No sample value for {cty_type!r}")
+
+
+def build_cases() -> dict[str, Any]:
+    """Return the cty object type of each nested-schema test component."""
+    from pyvider.components.data_sources import nested_data_test_suite as suite
+
+    components = {
+        "pyvider_simple_map_test": suite.SimpleMapDataSource,
+        "pyvider_mixed_map_test": suite.MixedMapDataSource,
+        "pyvider_structured_object_test": suite.StructuredObjectDataSource,
+        "pyvider_nested_resource_test": suite.NestedResourceTest,
+    }
+    return {name: component.get_schema().block.to_cty_type() for name, component in components.items()}
+
+
+def time_round_trip(cty_type: Any, raw: Any, iterations: int) -> tuple[float, float, int]:
+    """Return (unmarshal µs, marshal µs, payload bytes) averaged over ``iterations``."""
+    from pyvider.conversion import marshal, unmarshal
+
+    dynamic_value = marshal(raw, schema=cty_type)
+    value = unmarshal(dynamic_value, schema=cty_type)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        unmarshal(dynamic_value, schema=cty_type)
+    decode = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        marshal(value, schema=cty_type)
+    encode = (time.perf_counter() - start) / iterations * 1e6
+
+    return decode, encode, len(dynamic_value.msgpack)
+
+
+def time_function_call(width: int, iterations: int) -> tuple[float, float, int]:
+    """Return (unmarshal µs, marshal µs, payload bytes) for one ``pyvider_nested_data_processor`` call."""
+    from pyvider.components.data_sources.nested_data_test_suite import nested_data_processor
+    from pyvider.conversion import marshal, unmarshal
+    from pyvider.cty import CtyDynamic, CtyString
+    from pyvider.cty.conversion import cty_to_native
+
+    string = CtyString()
+    document = sample_value(CtyDynamic(), width)
+    arguments = [marshal(json.dumps(document), schema=string), marshal("analyze", schema=string)]
+    result = nested_data_processor(*(cty_to_native(unmarshal(a, schema=string)) for a in arguments))
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for argument in arguments:
+            cty_to_native(unmarshal(argument, schema=string))
+    decode = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        marshal(result, schema=string)
+    encode = (time.perf_counter() - start) / iterations * 1e6
+
+    size = sum(len(a.msgpack) for a in arguments) + len(marshal(result, schema=string).msgpack)
+    return decode, encode, size
+
+
+def main() -> int:
+    """Run the codec benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark cty codec cost per RPC for nested schemas")
+    parser.add_argument("--width", type=int, default=16, help="Entries per map/list/dynamic document")
+    parser.add_argument("--iterations", type=int, default=1000, help="Round trips per component")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    header = f"{'component':<34}{'bytes':>10}{'decode µs':>12}{'encode µs':>12}{'total µs':>12}"
+    print(header)
+    print("-" * len(header))
+
+    timings = {
+        name: time_round_trip(cty_type, sample_value(cty_type, args.width), args.iterations)
+        for name, cty_type in build_cases().items()
+    }
+    timings["pyvider_nested_data_processor"] = time_function_call(args.width, args.iterations)
+
+    for name, (decode, encode, size) in timings.items():
+        results[name] = {"bytes": size, "decode_us": decode, "encode_us": encode}
+        print(f"{name:<34}{size:>10,}{decode:>12.1f}{encode:>12.1f}{decode + encode:>12.1f}")
+
+    if args.json_path:
+        report = {"width": args.width, "iterations": args.iterations, "results": results}
+        Path(args.json_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n✅ Results written to {args.json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
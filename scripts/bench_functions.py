@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""Throughput benchmark for the provider function suite.
+
+Calls the pyvider-components function implementations directly (no gRPC)
+from a thread pool and reports function calls per second per case. Each
+case applies its function to every element of an input list of ``--batch``
+elements, the way a ``for`` expression over a large list does. Run it once
+under a regular interpreter and once under a free-threaded build
+(3.13t/3.14t) to compare GIL and no-GIL scaling. Each interpreter needs
+pyvider-components installed (e.g. a separate ``uv venv --python 3.13t``
+environment):
+
+    python scripts/bench_functions.py --threads 1 4 8
+    python3.13t scripts/bench_functions.py --threads 1 4 8
+    python scripts/bench_functions.py --cases format format_size --batch 10000 --iterations 3
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import json
+from pathlib import Path
+import sys
+import sysconfig
+import time
+from typing import Any
+
+
+def gil_enabled() -> bool:
+    """Report whether the running interpreter has the GIL enabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return True
+    return bool(is_gil_enabled())
+
+
+def build_cases(batch: int) -> dict[str, tuple[Callable[[], Any], int]]:
+    """Build the benchmark cases as (callable, function calls per invocation) pairs."""
+    from pyvider.components.functions import (
+        collection_functions as collections,
+        numeric_functions as numeric,
+        string_manipulation as strings,
+    )
+
+    words = [f"SomeKeyName{i}" for i in range(batch)]
+    numbers = list(range(batch))
+    keys = [f"key_{n}" for n in numbers]
+    lookup_map = dict.fromkeys(keys, 1)
+
+    # `{}` placeholders substitute in every pyvider-components release; a
+    # template that comes back unchanged would time no formatting at all.
+    formatted = strings.format_str("{}-{}", [words[0], 1])
+    if formatted != f"{words[0]}-1":
+        raise RuntimeError(f"format_str did not substitute its template: {formatted!r}")
+
+    per_element: dict[str, Callable[[], Any]] = {
+        "to_snake_case": lambda: [strings.snake_case(w) for w in words],
+        "to_camel_case": lambda: [strings.camel_case(w) for w in words],
+        "to_kebab_case": lambda: [strings.kebab_case(w) for w in words],
+        "upper": lambda: [strings.upper(w) for w in words],
+        "lower": lambda: [strings.lower(w) for w in words],
+        "pluralize": lambda: [strings.pluralize_word(w, 2) for w in words],
+        "format": lambda: [strings.format_str("{}-{}", [w, 1]) for w in words],
+        "format_size": lambda: [strings.format_file_size(n * 1024) for n in numbers],
+        "add": lambda: [numeric.add(n, n) for n in numbers],
+        "lookup": lambda: [collections.lookup(lookup_map, k) for k in keys],
+    }
+    whole_list: dict[str, Callable[[], Any]] = {
+        "join": lambda: strings.join(",", words),
+        "sum": lambda: numeric.sum_list(numbers),
+        "length": lambda: collections.length(numbers),
+    }
+    return {
+        **{name: (case, batch) for name, case in per_element.items()},
+        **{name: (case, 1) for name, case in whole_list.items()},
+    }
+
+
+def run_case(case: Callable[[], Any], calls: int, threads: int, iterations: int) -> float:
+    """Run ``iterations`` invocations of ``case`` spread over ``threads`` workers; return calls/s."""
+    per_worker = max(1, iterations // threads)
+
+    def worker() -> None:
+        for _ in range(per_worker):
+            case()
+
+    case()  # warm imports and caches outside the timed region
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for future in [pool.submit(worker) for _ in range(threads)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    return (per_worker * threads * calls) / elapsed
+
+
+def main() -> int:
+    """Run the function suite benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark provider function throughput")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4], help="Worker counts to test")
+    parser.add_argument("--batch", type=int, default=64, help="Elements in each case's input list")
+    parser.add_argument("--iterations", type=int, default=200, help="Passes over the batch per worker count")
+    parser.add_argument("--cases", nargs="*", help="Only run these cases (default: all)")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    cases = build_cases(args.batch)
+    selected = args.cases or list(cases)
+    unknown = sorted(set(selected) - set(cases))
+    if unknown:
+        print(f"❌ Unknown cases: {', '.join(unknown)}")
+        return 1
+
+    results: dict[str, dict[str, float]] = {}
+    header = f"{'case':<16}" + "".join(f"{f'{t} thr (calls/s)':>20}" for t in args.threads)
+
+    print(f"🐍 Python {sys.version.split()[0]}")
+    print(f"   free-threaded build: {bool(sysconfig.get_config_var('Py_GIL_DISABLED'))}")
+    print(f"   GIL enabled: {gil_enabled()}")
+    print()
+    print(header)
+    print("-" * len(header))
+
+    for name in selected:
+        case, calls = cases[name]
+        results[name] = {str(t): run_case(case, calls, t, args.iterations) for t in args.threads}
+        print(f"{name:<16}" + "".join(f"{results[name][str(t)]:>20,.0f}" for t in args.threads))
+
+    if args.json_path:
+        report = {
+            "python": sys.version,
+            "gil_enabled": gil_enabled(),
+            "threads": args.threads,
+            "batch": args.batch,
+            "iterations": args.iterations,
+            "results": results,
+        }
+        Path(args.json_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n✅ Results written to {args.json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+"""Multi-platform build orchestrator for the provider PSP.
+
+Resolves the runtime dependency set once from ``uv.lock``, downloads the
+wheels for every target platform concurrently into one shared wheel cache,
+and then packs with ``FLAVOR_WHEEL_CACHE`` pointing at that cache. flavor
+(0.5.4 and later, the dev-group pin) hands the cache to pip as an extra
+``--find-links`` source next to the index, and copies from it with
+``--no-index`` if that download fails. A platform already downloaded for
+the same requirements is skipped, so repeat runs only pay for the pack.
+Prints a timing breakdown per stage (and appends it to the GitHub step
+summary when running in Actions):
+
+    python scripts/build_all.py                       # all stages, all platforms
+    python scripts/build_all.py --stages resolve download
+    python scripts/build_all.py --stages pack --cache-dir wheel-cache --output terraform-provider-pyvider.psp
+
+``flavor pack`` builds for the host it runs on, so the pack stage only packs
+the host platform; the other platforms are packed by their own CI runners
+from the same pre-warmed cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import platform
+import shutil
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PYTHON_VERSION = (PROJECT_ROOT / ".python-version").read_text(encoding="utf-8").strip()
+STAGES = ("resolve", "download", "pack")
+
+# pip expands these to every compatible older manylinux/macOS tag.
+PLATFORM_TAGS: dict[str, str] = {
+    "linux_amd64": "manylinux2014_x86_64",
+    "linux_arm64": "manylinux2014_aarch64",
+    "darwin_amd64": "macosx_11_0_x86_64",
+    "darwin_arm64": "macosx_11_0_arm64",
+}
+
+
+def host_platform() -> str:
+    """Return the host platform in Terraform's os_arch naming."""
+    arch = {"x86_64": "amd64", "aarch64": "arm64"}.get(platform.machine().lower(), platform.machine().lower())
+    return f"{platform.system().lower()}_{arch}"
+
+
+def run(cmd: list[str], env: dict[str, str] | None = None) -> None:
+    """Run a build command from the project root, failing loudly."""
+    subprocess.run(cmd, cwd=PROJECT_ROOT, check=True, env=env)
+
+
+def resolve(build_dir: Path) -> Path:
+    """Export the locked runtime requirements once for all platforms."""
+    requirements = build_dir / "requirements.txt"
+    run(
+        [
+            "uv",
+            "export",
+            "--frozen",
+            "--no-dev",
+            "--no-emit-project",
+            "--no-hashes",
+            "--output-file",
+            str(requirements),
+        ]
+    )
+    return requirements
+
+
+def download_platform(target: str, requirements: Path, build_dir: Path) -> Path:
+    """Download the binary wheels one platform needs into its own staging directory.
+
+    The requirements each staging directory was filled from are kept next to
+    its wheels; when they match the current export the download is skipped.
+    """
+    staging = build_dir / "wheels" / target
+    staged_requirements = staging / "requirements.txt"
+    current = requirements.read_text(encoding="utf-8")
+    if staged_requirements.exists() and staged_requirements.read_text(encoding="utf-8") == current:
+        print(f"⏭️  {target}: wheels already downloaded for these requirements")
+        return staging
+
+    staging.mkdir(parents=True, exist_ok=True)
+    run(
+        [
+            "uv",
+            "tool",
+            "run",
+            "pip",
+            "download",
+            "--quiet",
+            "--only-binary=:all:",
+            "--implementation",
+            "cp",
+            "--python-version",
+            PYTHON_VERSION,
+            "--platform",
+            PLATFORM_TAGS[target],
+            "--requirement",
+            str(requirements),
+            "--dest",
+            str(staging),
+        ]
+    )
+    staged_requirements.write_text(current, encoding="utf-8")
+    return staging
+
+
+def download(targets: list[str], requirements: Path, build_dir: Path, cache_dir: Path) -> None:
+    """Download every platform concurrently, then merge into the shared flat cache."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        staged = list(pool.map(lambda t: download_platform(t, requirements, build_dir), targets))
+
+    for staging in staged:
+        for wheel in staging.glob("*.whl"):
+            if not (cache_dir / wheel.name).exists():
+                shutil.copy2(wheel, cache_dir / wheel.name)
+    print(f"📦 Shared wheel cache: {cache_dir} ({len(list(cache_dir.glob('*.whl')))} wheels)")
+
+
+def pack(cache_dir: Path, output: Path | None) -> None:
+    """Pack the host platform using the shared wheel cache."""
+    env = {**os.environ, "FLAVOR_WHEEL_CACHE": str(cache_dir.resolve())}
+    cmd = ["flavor", "pack", "--manifest", str(PROJECT_ROOT / "pyproject.toml")]
+    if output is not None:
+        cmd += ["--output", str(output.resolve())]
+    run(cmd, env=env)
+
+
+def report(timings: dict[str, float]) -> None:
+    """Print the per-stage timing breakdown, and add it to the GitHub step summary."""
+    print()
+    print(f"{'stage':<24}{'seconds':>10}")
+    print("-" * 34)
+    for stage, seconds in timings.items():
+        print(f"{stage:<24}{seconds:>10.1f}")
+    print(f"{'total':<24}{sum(timings.values()):>10.1f}")
+
+    summary = os.environ.get("GITHUB_STEP_SUMMARY")
+    if summary:
+        lines = ["### ⏱️ Build stage timings", "", "| Stage | Seconds |", "| --- | ---: |"]
+        lines += [f"| {stage} | {seconds:.1f} |" for stage, seconds in timings.items()]
+        with Path(summary).open("a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def main() -> int:
+    """Run the requested build stages."""
+    parser = argparse.ArgumentParser(
+        description="Resolve once, download concurrently, pack with a shared cache"
+    )
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="Stages to run")
+    parser.add_argument(
+        "--platforms",
+        nargs="+",
+        choices=sorted(PLATFORM_TAGS),
+        default=sorted(PLATFORM_TAGS),
+        help="Platforms to download wheels for",
+    )
+    parser.add_argument("--build-dir", type=Path, default=PROJECT_ROOT / "build", help="Scratch directory")
+    parser.add_argument(
+        "--cache-dir", type=Path, default=PROJECT_ROOT / "build" / "wheel-cache", help="Shared wheel cache"
+    )
+    parser.add_argument("--output", type=Path, help="PSP output path (default: flavor's dist/<name>.psp)")
+    args = parser.parse_args()
+
+    args.build_dir.mkdir(parents=True, exist_ok=True)
+    timings: dict[str, float] = {}
+    requirements = args.build_dir / "requirements.txt"
+
+    if "resolve" in args.stages:
+        start = time.perf_counter()
+        requirements = resolve(args.build_dir)
+        timings["resolve"] = time.perf_counter() - start
+
+    if "download" in args.stages:
+        start = time.perf_counter()
+        download(args.platforms, requirements, args.build_dir, args.cache_dir)
+        timings[f"download ({len(args.platforms)} platforms)"] = time.perf_counter() - start
+
+    if "pack" in args.stages:
+        start = time.perf_counter()
+        pack(args.cache_dir, args.output)
+        timings[f"pack ({host_platform()})"] = time.perf_counter() - start
+
+    report(timings)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+"""Synthetic load generator for scaling tests against the installed provider.
+
+Turns the first resource block of an ``examples/resource/<name>/basic.tf``
+template into a ``count = N`` configuration, one directory per scale, then
+drives Terraform through the plan/apply/refresh sequence for each scale and
+records wall time and the peak RSS of the provider processes Terraform
+spawns. RSS is read from /proc, so on hosts without it (macOS) the RSS column
+is left empty:
+
+    python scripts/scale_examples.py generate file_content --scales 100 1000 10000
+    python scripts/scale_examples.py run file_content --scales 100 1000 10000
+
+Results are written as CSV; a PNG plot is added when matplotlib is installed.
+The provider must be installed locally first (``make install``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+from pathlib import Path
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES_DIR = PROJECT_ROOT / "examples" / "resource"
+DEFAULT_OUT_DIR = PROJECT_ROOT / "build" / "scale"
+
+# Attributes that name a filesystem object or identity and therefore must be
+# unique per instance.
+PATH_ATTRIBUTES = ("filename", "path")
+NAME_ATTRIBUTES = ("name",)
+
+# Terraform commands issued per scale, in the order Terraform itself would
+# exercise the provider: PlanResourceChange, ApplyResourceChange, then
+# ReadResource on refresh.
+PHASES: dict[str, list[str]] = {
+    "plan": ["plan", "-input=false", "-lock=false"],
+    "apply": ["apply", "-input=false", "-auto-approve", "-lock=false"],
+    "refresh": ["apply", "-input=false", "-auto-approve", "-refresh-only", "-lock=false"],
+}
+
+
+def extract_first_resource(source: str) -> str:
+    """Return the first top-level ``resource`` block of an HCL file."""
+    match = re.search(r'^resource\s+"[^"]+"\s+"[^"]+"\s*\{', source, re.MULTILINE)
+    if match is None:
+        raise ValueError("No resource block found in template")
+
+    depth = 0
+    for index in range(match.end() - 1, len(source)):
+        if source[index] == "{":
+            depth += 1
+        elif source[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return source[match.start() : index + 1]
+    raise ValueError("Unterminated resource block in template")
+
+
+def parametrize_block(block: str, count: int) -> str:
+    """Add ``count`` to a resource block and make identifying attributes unique per instance."""
+
+    def rewrite(match: re.Match[str]) -> str:
+        prefix, key, value = match.group(1), match.group(2), match.group(3)
+        if key in PATH_ATTRIBUTES:
+            path = Path(value)
+            value = f"${{path.module}}/out/{path.stem}-${{count.index}}{path.suffix}"
+        else:
+            value = f"{value}-${{count.index}}"
+        return f'{prefix}"{value}"'
+
+    keys = "|".join(PATH_ATTRIBUTES + NAME_ATTRIBUTES)
+    body = re.sub(rf'^(\s*({keys})\s*=\s*)"([^"$]*)"', rewrite, block, flags=re.MULTILINE)
+    header, rest = body.split("{", 1)
+    return f"{header}{{\n  count = {count}\n{rest}"
+
+
+def generate(component: str, scales: list[int], out_dir: Path) -> list[Path]:
+    """Write one Terraform configuration directory per scale; return the directories."""
+    template_dir = EXAMPLES_DIR / component
+    if not template_dir.is_dir():
+        raise FileNotFoundError(f"No example templates for '{component}' in {EXAMPLES_DIR}")
+
+    block = extract_first_resource((template_dir / "basic.tf").read_text(encoding="utf-8"))
+    config_dirs = []
+    for scale in scales:
+        config_dir = out_dir / component / str(scale)
+        (config_dir / "out").mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(template_dir / "provider.tf", config_dir / "provider.tf")
+        (config_dir / "main.tf").write_text(parametrize_block(block, scale) + "\n", encoding="utf-8")
+        config_dirs.append(config_dir)
+        print(f"✅ Generated {config_dir} ({scale} instances)")
+    return config_dirs
+
+
+class TerraformError(RuntimeError):
+    """A Terraform command failed during a scaling run."""
+
+
+def descendant_pids(pid: int) -> list[int]:
+    """Return every descendant of ``pid`` via /proc/<pid>/task/*/children (Linux only)."""
+    descendants: list[int] = []
+    pending = [pid]
+    while pending:
+        for children in Path(f"/proc/{pending.pop()}/task").glob("*/children"):
+            try:
+                child_pids = [int(child) for child in children.read_text().split()]
+            except OSError:
+                continue
+            descendants.extend(child_pids)
+            pending.extend(child_pids)
+    return descendants
+
+
+def provider_rss_bytes(terraform_pid: int) -> int:
+    """Sum the resident set size of the processes Terraform spawned, i.e. the provider."""
+    total = 0
+    for pid in descendant_pids(terraform_pid):
+        try:
+            for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total += int(line.split()[1]) * 1024
+                    break
+        except OSError:
+            continue
+    return total
+
+
+class RssSampler:
+    """Background sampler recording the peak RSS of one Terraform run's provider processes."""
+
+    def __init__(self, terraform_pid: int, interval: float = 0.1) -> None:
+        self.terraform_pid = terraform_pid
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, provider_rss_bytes(self.terraform_pid))
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> RssSampler:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def run_terraform(
+    terraform: str, config_dir: Path, args: list[str], label: str, sample_rss: bool
+) -> tuple[float, int | None]:
+    """Run one Terraform command; return (seconds, peak provider RSS bytes, or None if not sampled).
+
+    Raises:
+        TerraformError: If the command fails, carrying Terraform's stderr.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [terraform, *args],
+        cwd=config_dir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    peak_rss = None
+    if sample_rss:
+        with RssSampler(process.pid) as sampler:
+            _, stderr = process.communicate()
+        peak_rss = sampler.peak
+    else:
+        _, stderr = process.communicate()
+    elapsed = time.perf_counter() - start
+
+    if process.returncode != 0:
+        raise TerraformError(
+            f"{label} failed (exit {process.returncode}) in {config_dir}; "
+            f"state there is left for inspection or `terraform destroy`.\n{stderr.strip()}"
+        )
+    return elapsed, peak_rss
+
+
+def plot(rows: list[dict[str, str]], output: Path) -> None:
+    """Plot latency and RSS against instance count, if matplotlib is available."""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("⏭️  matplotlib not installed, skipping plot")
+        return
+
+    panels = {"seconds": "seconds"}
+    if all(r["peak_rss_mb"] for r in rows):
+        panels["peak_rss_mb"] = "peak provider RSS (MB)"
+    fig, axes = plt.subplots(1, len(panels), figsize=(6 * len(panels), 5), squeeze=False)
+    for ax, (column, label) in zip(axes[0], panels.items(), strict=True):
+        for phase in PHASES:
+            points = [r for r in rows if r["phase"] == phase]
+            scales = [int(r["instances"]) for r in points]
+            ax.plot(scales, [float(r[column]) for r in points], marker="o", label=phase)
+        ax.set_xscale("log")
+        ax.set_xlabel("instances")
+        ax.set_ylabel(label)
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(output)
+    print(f"📈 Plot written to {output}")
+
+
+def run(
+    component: str, scales: list[int], out_dir: Path, terraform: str, sample_rss: bool
+) -> list[dict[str, str]]:
+    """Generate, then plan/apply/refresh each scale and collect timings."""
+    rows: list[dict[str, str]] = []
+    for scale, config_dir in zip(scales, generate(component, scales, out_dir), strict=True):
+        run_terraform(terraform, config_dir, ["init", "-input=false"], f"init at {scale} instances", False)
+        for phase, args in PHASES.items():
+            seconds, peak_rss = run_terraform(
+                terraform, config_dir, args, f"{phase} at {scale} instances", sample_rss
+            )
+            peak_rss_mb = "" if peak_rss is None else f"{peak_rss / 1024 / 1024:.1f}"
+            rows.append(
+                {
+                    "component": component,
+                    "instances": str(scale),
+                    "phase": phase,
+                    "seconds": f"{seconds:.3f}",
+                    "peak_rss_mb": peak_rss_mb,
+                }
+            )
+            print(f"  {scale:>7} {phase:<8} {seconds:8.2f}s  {peak_rss_mb or '-':>8} MB")
+        run_terraform(
+            terraform,
+            config_dir,
+            ["destroy", "-input=false", "-auto-approve", "-lock=false"],
+            f"destroy at {scale} instances",
+            False,
+        )
+    return rows
+
+
+def main() -> int:
+    """Generate scaled configurations and optionally run them."""
+    parser = argparse.ArgumentParser(description="Generate and run scaled provider configurations")
+    parser.add_argument("command", choices=["generate", "run"])
+    parser.add_argument("component", help="Example under examples/resource/ (e.g. file_content)")
+    parser.add_argument("--scales", type=int, nargs="+", default=[10, 100, 1000], help="Instance counts")
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="Where configs are written")
+    parser.add_argument("--terraform", default="terraform", help="Terraform or OpenTofu binary")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        generate(args.component, args.scales, args.out_dir)
+        return 0
+
+    if shutil.which(args.terraform) is None:
+        print(f"❌ '{args.terraform}' not found on PATH")
+        return 1
+
+    sample_rss = Path("/proc").is_dir()
+    if not sample_rss:
+        print("⚠️  /proc not available on this host; peak RSS will not be recorded")
+
+    try:
+        rows = run(args.component, args.scales, args.out_dir, args.terraform, sample_rss)
+    except TerraformError as e:
+        print(f"❌ {args.component}: {e}")
+        return 1
+    results = args.out_dir / f"{args.component}.csv"
+    with results.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"✅ Results written to {results}")
+    plot(rows, args.out_dir / f"{args.component}.png")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())